@@ -5,6 +5,8 @@ import os
 import time
 import subprocess
 import sys
+import uuid
+from collections import OrderedDict
 from datetime import datetime
 
 app = Flask(__name__, template_folder='templates', static_folder='static')
@@ -12,8 +14,17 @@ app = Flask(__name__, template_folder='templates', static_folder='static')
 # Get the Scripts directory path
 script_dir = os.path.dirname(os.path.abspath(__file__))
 
-# Job tracking
-JOBS = {}
+# Job tracking (guarded by JOBS_LOCK: written by request and worker threads)
+JOBS = OrderedDict()
+JOBS_LOCK = threading.Lock()
+
+# Minimum seconds between progress writes from a running job
+PROGRESS_UPDATE_INTERVAL = 0.1
+
+def update_job(job_id, **fields):
+    """Atomically update fields of a tracked job."""
+    with JOBS_LOCK:
+        JOBS[job_id].update(fields)
 
 # Available motion effects
 MOTION_EFFECTS = {
@@ -52,11 +63,17 @@ def batch_worker(job_id, input_dir, motion_types, quality, fps, duration):
         output_path = os.path.join(script_dir, 'Output')
         
         # Update job status
-        JOBS[job_id]['status'] = 'running'
+        update_job(job_id, status='running')
+        
+        last_update = [0.0]
         
         def progress_callback(current, total):
-            """Update job progress."""
-            JOBS[job_id]['progress'] = int((current / total) * 100)
+            """Update job progress (throttled, but the final update always lands)."""
+            now = time.monotonic()
+            if current < total and now - last_update[0] < PROGRESS_UPDATE_INTERVAL:
+                return
+            last_update[0] = now
+            update_job(job_id, progress=int((current / total) * 100))
         
         # Create videos
         videos, metadata = create_video_per_image_with_motion(
@@ -69,15 +86,20 @@ def batch_worker(job_id, input_dir, motion_types, quality, fps, duration):
             progress_callback=progress_callback
         )
         
-        JOBS[job_id]['status'] = 'done'
-        JOBS[job_id]['progress'] = 100
-        JOBS[job_id]['output'] = videos
-        JOBS[job_id]['metadata'] = metadata
-        JOBS[job_id]['message'] = f"Successfully created {len(videos)} videos in {metadata['total_processing_time']}s"
+        message = f"Successfully created {len(videos)} videos in {metadata['total_processing_time']}s"
+        if metadata['failed']:
+            message += f" ({len(metadata['failed'])} images failed)"
+        update_job(
+            job_id,
+            status='done',
+            progress=100,
+            output=videos,
+            metadata=metadata,
+            message=message
+        )
     
     except Exception as e:
-        JOBS[job_id]['status'] = 'error'
-        JOBS[job_id]['message'] = str(e)
+        update_job(job_id, status='error', message=str(e))
 
 @app.route('/')
 def index():
@@ -114,21 +136,22 @@ def batch_start():
     
     print(f"DEBUG: Final motion_types after conversion: {motion_types}")
     
-    # Create job ID
-    job_id = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+    # Create job ID (random, so burst submissions can't collide)
+    job_id = uuid.uuid4().hex
     
     # Initialize job
-    JOBS[job_id] = {
-        'status': 'queued',
-        'progress': 0,
-        'output': [],
-        'message': 'Job queued',
-        'motion_types': motion_types,
-        'quality': quality,
-        'fps': fps,
-        'duration': duration,
-        'start_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    }
+    with JOBS_LOCK:
+        JOBS[job_id] = {
+            'status': 'queued',
+            'progress': 0,
+            'output': [],
+            'message': 'Job queued',
+            'motion_types': motion_types,
+            'quality': quality,
+            'fps': fps,
+            'duration': duration,
+            'start_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
     
     # Start background worker
     worker = threading.Thread(
@@ -143,10 +166,14 @@ def batch_start():
 @app.route('/status/<job_id>')
 def status(job_id):
     """Get job status."""
-    if job_id not in JOBS:
+    # Build the response from a snapshot so the worker is never blocked on JSON encoding
+    with JOBS_LOCK:
+        job = JOBS.get(job_id)
+        if job is not None:
+            job = dict(job)
+    if job is None:
         return jsonify({'error': 'Job not found'}), 404
     
-    job = JOBS[job_id]
     response = {
         'status': job['status'],
         'progress': job['progress'],
@@ -1,12 +1,46 @@
 import cv2
 import numpy as np
 import os
+import math
+import queue
+import shutil
+import subprocess
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import closing
 try:
     from PIL import Image
     PIL_AVAILABLE = True
 except Exception:
     PIL_AVAILABLE = False
-import glob
+try:
+    import numba
+    from numba import njit, prange, set_num_threads
+    # The parallel kernels run from concurrent Flask worker threads; numba's
+    # default workqueue layer aborts the process on concurrent use, so only
+    # accept a thread-safe layer (TBB or OpenMP)
+    numba.config.THREADING_LAYER = 'threadsafe'
+    NUMBA_AVAILABLE = True
+except Exception:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    # Cached like the kernels, so spawned workers don't recompile it; the
+    # threading layer is still loaded (and checked) on the first call
+    @njit(parallel=True, cache=True)
+    def _threading_layer_probe(n):
+        total = 0
+        for i in prange(n):
+            total += i
+        return total
+    
+    try:
+        _threading_layer_probe(2)
+    except Exception:
+        # No thread-safe layer installed: use the NumPy kernels instead
+        NUMBA_AVAILABLE = False
 from datetime import datetime
 
 # Quality presets: (width, height, bitrate_factor)
@@ -18,23 +52,264 @@ QUALITY_PRESETS = {
     '360p': (640, 360, 0.3),
 }
 
+# GPU warps need an OpenCV build with CUDA (the pip wheels report 0 devices)
+try:
+    CUDA_AVAILABLE = cv2.cuda.getCudaEnabledDeviceCount() > 0
+except Exception:
+    CUDA_AVAILABLE = False
+
+# Worker processes sharing the GPU; each holds its own CUDA context and buffers
+CUDA_MAX_WORKERS = 2
+
+# Per-thread scratch buffers reused across frames (and images of the same size)
+_SCRATCH = threading.local()
+
+def _scratch_buffer(name, shape, dtype=np.float32):
+    """Return a reusable uninitialised buffer owned by the calling thread."""
+    buffers = getattr(_SCRATCH, 'buffers', None)
+    if buffers is None:
+        buffers = _SCRATCH.buffers = {}
+    buf = buffers.get(name)
+    if buf is None or buf.shape != shape or buf.dtype != dtype:
+        buf = buffers[name] = np.empty(shape, dtype=dtype)
+    return buf
+
+# Read-only float32 pixel coordinate grids keyed by (height, width)
+_MESH_CACHE = {}
+
+def _mesh_grid(height, width):
+    """Return cached float32 (X, Y) coordinate grids for an image of the given size."""
+    grid = _MESH_CACHE.get((height, width))
+    if grid is None:
+        x, y = np.meshgrid(np.arange(width, dtype=np.float32), np.arange(height, dtype=np.float32))
+        x.flags.writeable = False
+        y.flags.writeable = False
+        grid = _MESH_CACHE[(height, width)] = (x, y)
+    return grid
+
+if NUMBA_AVAILABLE:
+    @njit('void(f4[:, :], f4[:, :], i4, i4, f4, f4, f4)', parallel=True, fastmath=True, cache=True)
+    def _build_wave_maps(map_x, map_y, width, height, wave_amp, freq, phase):
+        """Fill map_x/map_y with the wave displacement, clipped to the image bounds."""
+        dy = np.empty(width, dtype=np.float32)
+        for x in range(width):
+            dy[x] = wave_amp * math.cos(x * freq + phase)
+        for y in prange(height):
+            dx = wave_amp * math.sin(y * freq + phase)
+            for x in range(width):
+                map_x[y, x] = min(max(x + dx, 0.0), width - 1)
+                map_y[y, x] = min(max(y + dy[x], 0.0), height - 1)
+else:
+    def _build_wave_maps(map_x, map_y, width, height, wave_amp, freq, phase):
+        """Fill map_x/map_y with the wave displacement, clipped to the image bounds."""
+        x, y = _mesh_grid(height, width)
+        # x offset only varies by row and y offset only by column
+        np.add(x, wave_amp * np.sin(y[:, :1] * freq + phase), out=map_x)
+        np.add(y, wave_amp * np.cos(x[:1] * freq + phase), out=map_y)
+        np.clip(map_x, 0, width - 1, out=map_x)
+        np.clip(map_y, 0, height - 1, out=map_y)
+
+# Include HEIC in case user has Apple HEIC images. If not installed, files will be skipped.
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.heic'}
+
+# H.264 encoders in order of preference (hardware first) with their ffmpeg options
+FFMPEG_ENCODERS = [
+    ('h264_nvenc', ['-preset', 'p4']),
+    ('h264_qsv', ['-preset', 'veryfast']),
+    ('h264_videotoolbox', []),
+    ('libx264', ['-preset', 'ultrafast']),
+]
+
+# Bitrate at bitrate_factor 1.0 (1080p), in kbit/s
+BASE_BITRATE_KBPS = 8000
+
+def detect_ffmpeg_encoder():
+    """Find the best working H.264 encoder of the ffmpeg on PATH.
+
+    Returns (ffmpeg_path, encoder_name, encoder_args) or None if ffmpeg is
+    missing or none of FFMPEG_ENCODERS works on this machine.
+    """
+    ffmpeg = shutil.which('ffmpeg')
+    if ffmpeg is None:
+        return None
+    try:
+        listing = subprocess.run([ffmpeg, '-hide_banner', '-encoders'],
+                                 capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    available = {line.split()[1] for line in listing.splitlines() if len(line.split()) > 1}
+    
+    for name, args in FFMPEG_ENCODERS:
+        if name not in available:
+            continue
+        # Hardware encoders are listed even without the hardware, so try a tiny encode
+        try:
+            probe = subprocess.run([ffmpeg, '-hide_banner', '-loglevel', 'error',
+                                    '-f', 'lavfi', '-i', 'color=size=256x256:rate=1:duration=1',
+                                    '-c:v', name, *args, '-f', 'null', '-'],
+                                   capture_output=True, timeout=30)
+        except (OSError, subprocess.SubprocessError):
+            continue
+        if probe.returncode == 0:
+            return ffmpeg, name, args
+    return None
+
+class FFmpegVideoWriter:
+    """cv2.VideoWriter-compatible writer that pipes raw BGR frames into ffmpeg."""
+    
+    def __init__(self, output_path, fps, frame_size, encoder, bitrate_kbps, repeat=1):
+        ffmpeg, name, args = encoder
+        width, height = frame_size
+        self.output_path = output_path
+        self.frame_shape = (height, width, 3)
+        self.error = None
+        # With repeat > 1 only one frame is written; ffmpeg's loop filter repeats it
+        loop_filter = ['-vf', f'loop=loop={repeat - 1}:size=1:start=0'] if repeat > 1 else []
+        self.proc = subprocess.Popen(
+            [ffmpeg, '-y', '-hide_banner', '-loglevel', 'error',
+             '-f', 'rawvideo', '-pix_fmt', 'bgr24', '-s', f'{width}x{height}',
+             '-r', str(fps), '-i', '-', *loop_filter,
+             '-c:v', name, *args, '-b:v', f'{bitrate_kbps}k',
+             '-pix_fmt', 'yuv420p', '-movflags', '+faststart', output_path],
+            stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+    
+    def write(self, frame):
+        # ffmpeg reads a fixed byte count per frame, so anything else would
+        # silently corrupt the stream (extra frames, shifted pixels)
+        if frame.dtype != np.uint8 or frame.shape != self.frame_shape:
+            raise ValueError(f"Expected a uint8 frame of shape {self.frame_shape}, "
+                             f"got {frame.dtype} {frame.shape}")
+        if self.error is not None:
+            raise RuntimeError(self.error)
+        try:
+            self.proc.stdin.write(np.ascontiguousarray(frame))
+        except BrokenPipeError:
+            # ffmpeg exited early; release() reports its error output
+            self.release()
+    
+    def release(self):
+        # Safe to call again (write() releases on a broken pipe): later calls
+        # report the same ffmpeg error instead of reading the closed pipes
+        if self.error is None and not self.proc.stderr.closed:
+            if not self.proc.stdin.closed:
+                try:
+                    self.proc.stdin.close()
+                except BrokenPipeError:
+                    pass
+            stderr = self.proc.stderr.read()
+            self.proc.stderr.close()
+            returncode = self.proc.wait()
+            if returncode != 0:
+                self.error = (f"ffmpeg failed (exit {returncode}) writing '{self.output_path}': "
+                              f"{stderr.decode(errors='replace').strip()}")
+        if self.error is not None:
+            raise RuntimeError(self.error)
+
+def open_video_writer(output_base, fps, frame_size, bitrate_factor, encoder=None):
+    """Open a video writer for `output_base` (path without extension).
+
+    Uses an H.264 .mp4 through ffmpeg when an encoder is given (see
+    detect_ffmpeg_encoder), otherwise OpenCV's XVID .avi writer.
+    Returns (writer, output_path).
+    """
+    if encoder is not None:
+        output_path = output_base + '.mp4'
+        bitrate_kbps = int(BASE_BITRATE_KBPS * bitrate_factor)
+        return FFmpegVideoWriter(output_path, fps, frame_size, encoder, bitrate_kbps), output_path
+    
+    # XVID codec for Windows compatibility when ffmpeg is not installed
+    output_path = output_base + '.avi'
+    fourcc = cv2.VideoWriter_fourcc(*'XVID')
+    return cv2.VideoWriter(output_path, fourcc, fps, frame_size), output_path
+
+def write_still_video(output_base, img, total_frames, fps, frame_size, bitrate_factor,
+                      encoder=None):
+    """Write a video that holds `img` for `total_frames` frames.
+
+    With ffmpeg the frame is piped once and repeated by the encoder;
+    the OpenCV fallback has to write it every frame. Returns the output path.
+    """
+    # Checked before any writer is opened, so nothing is left half-written
+    expected_shape = (frame_size[1], frame_size[0], 3)
+    if img.dtype != np.uint8 or img.shape != expected_shape:
+        raise ValueError(f"Expected a uint8 frame of shape {expected_shape}, "
+                         f"got {img.dtype} {img.shape}")
+    
+    if encoder is not None:
+        output_path = output_base + '.mp4'
+        bitrate_kbps = int(BASE_BITRATE_KBPS * bitrate_factor)
+        writer = FFmpegVideoWriter(output_path, fps, frame_size, encoder, bitrate_kbps,
+                                   repeat=total_frames)
+        writer.write(img)
+        writer.release()
+        return output_path
+    
+    writer, output_path = open_video_writer(output_base, fps, frame_size, bitrate_factor)
+    for _ in range(total_frames):
+        writer.write(img)
+    writer.release()
+    return output_path
+
+if NUMBA_AVAILABLE:
+    @njit('void(u1[:, :, ::1], u1[:, :, ::1], f4[::1], i8, i8)',
+          parallel=True, fastmath=True, cache=True, boundscheck=False)
+    def _blend_rows(sharp, blurred, mask, start, stop):
+        """Blend rows [start, stop) of `sharp` into `blurred` in place, weighted by mask[row]."""
+        width, channels = sharp.shape[1], sharp.shape[2]
+        for y in prange(start, stop):
+            m = mask[y]
+            for x in range(width):
+                for ch in range(channels):
+                    b = np.float32(blurred[y, x, ch])
+                    blurred[y, x, ch] = np.uint8(b + (np.float32(sharp[y, x, ch]) - b) * m)
+else:
+    def _blend_rows(sharp, blurred, mask, start, stop):
+        """Blend rows [start, stop) of `sharp` into `blurred` in place, weighted by mask[row]."""
+        rows = slice(start, stop)
+        # blurred + (sharp - blurred) * mask in a reused float32 buffer, with the mask broadcast across rows
+        blend = _scratch_buffer('tilt_blend', sharp.shape)
+        np.subtract(sharp[rows], blurred[rows], out=blend[rows], dtype=np.float32)
+        blend[rows] *= mask[rows, None, None]
+        blend[rows] += blurred[rows]
+        np.copyto(blurred[rows], blend[rows], casting='unsafe')
+
 def collect_images(input_dir):
     """Collect all image files from input directory in sorted order."""
-    if not os.path.exists(input_dir):
+    if not os.path.isdir(input_dir):
         return []
     
-    # Include HEIC in case user has Apple HEIC images. If not installed, files will be skipped.
-    image_patterns = ['*.png', '*.jpg', '*.jpeg', '*.bmp', '*.tiff', '*.heic']
-    images = []
-    
-    for pattern in image_patterns:
-        images.extend(glob.glob(os.path.join(input_dir, pattern)))
+    # Single directory pass, matching extensions case-insensitively; hidden
+    # files are skipped as glob did
+    with os.scandir(input_dir) as entries:
+        images = [entry.path for entry in entries
+                  if not entry.name.startswith('.') and entry.is_file()
+                  and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS]
     
     return sorted(images)
 
-def apply_subtle_motion(img, frame_idx, total_frames):
-    """Apply subtle zoom and circular pan motion."""
-    height, width = img.shape[:2]
+def affine_matrix(center, zoom, angle=0.0, pan=(0, 0)):
+    """
+    2x3 matrix zooming/rotating about `center`, then shifting by `pan`.
+    
+    Same result as cv2.getRotationMatrix2D (angle in degrees, counter-clockwise)
+    plus the pan offset, built directly to skip the OpenCV call per frame.
+    """
+    cx, cy = center
+    if angle == 0:
+        alpha, beta = zoom, 0.0
+    else:
+        radians = math.radians(angle)
+        alpha = zoom * math.cos(radians)
+        beta = zoom * math.sin(radians)
+    return np.array([[alpha, beta, (1 - alpha) * cx - beta * cy + pan[0]],
+                     [-beta, alpha, beta * cx + (1 - alpha) * cy + pan[1]]])
+
+def compose_affine(outer, inner):
+    """Compose two 2x3 affine matrices so that one warp equals applying `inner` then `outer`."""
+    return outer @ np.vstack([inner, [0.0, 0.0, 1.0]])
+
+def subtle_motion_matrix(frame_idx, total_frames, width, height):
+    """2x3 warp matrix of the subtle zoom and circular pan effect for one frame."""
     progress = frame_idx / max(total_frames - 1, 1)
     
     # Subtle zoom (1.0 -> 1.15)
@@ -46,17 +321,21 @@ def apply_subtle_motion(img, frame_idx, total_frames):
     
     # Create transformation matrix
     center = (width // 2, height // 2)
-    M = cv2.getRotationMatrix2D(center, 0, zoom)
-    M[0, 2] += pan_x
-    M[1, 2] += pan_y
+    M = affine_matrix(center, zoom, pan=(pan_x, pan_y))
+    
+    return M
+
+def apply_subtle_motion(img, frame_idx, total_frames):
+    """Apply subtle zoom and circular pan motion."""
+    height, width = img.shape[:2]
+    M = subtle_motion_matrix(frame_idx, total_frames, width, height)
     
     # Apply transformation
     transformed = cv2.warpAffine(img, M, (width, height), borderMode=cv2.BORDER_REFLECT)
     return transformed
 
-def apply_ken_burns_effect(img, frame_idx, total_frames):
-    """Apply Ken Burns zoom and pan effect."""
-    height, width = img.shape[:2]
+def ken_burns_matrix(frame_idx, total_frames, width, height):
+    """2x3 warp matrix of the Ken Burns zoom and pan effect for one frame."""
     progress = frame_idx / max(total_frames - 1, 1)
     
     # Progressive zoom (1.0 -> 1.3)
@@ -67,27 +346,32 @@ def apply_ken_burns_effect(img, frame_idx, total_frames):
     pan_y = int(25 * (progress - 0.5))
     
     center = (width // 2, height // 2)
-    M = cv2.getRotationMatrix2D(center, 0, zoom)
-    M[0, 2] += pan_x
-    M[1, 2] += pan_y
+    M = affine_matrix(center, zoom, pan=(pan_x, pan_y))
+    
+    return M
+
+def apply_ken_burns_effect(img, frame_idx, total_frames):
+    """Apply Ken Burns zoom and pan effect."""
+    height, width = img.shape[:2]
+    M = ken_burns_matrix(frame_idx, total_frames, width, height)
     
     transformed = cv2.warpAffine(img, M, (width, height), borderMode=cv2.BORDER_REFLECT)
     return transformed
 
 def apply_360_pan_effect(img, frame_idx, total_frames):
-    """Apply 360-degree panoramic pan effect by tiling and panning."""
+    """Apply 360-degree panoramic pan effect by panning with horizontal wraparound."""
     height, width = img.shape[:2]
     progress = frame_idx / max(total_frames - 1, 1)
     
-    # Create a 3x wide tiled version for continuous panoramic pan
-    tiled = np.hstack([img, img, img])
-    tiled_width = tiled.shape[1]
-    
-    # Pan from left to right across tiled image
-    start_x = int((tiled_width - width) * progress)
+    # Pan left to right across two widths of the (virtually) tiled image
+    start_x = int(2 * width * progress) % width
+    if start_x == 0:
+        return img.copy()
     
-    # Extract window
-    panned = tiled[:, start_x:start_x + width]
+    # Window wraps around the right edge: two contiguous column copies
+    panned = np.empty_like(img)
+    panned[:, :width - start_x] = img[:, start_x:]
+    panned[:, width - start_x:] = img[:, :start_x]
     
     return panned
 
@@ -99,36 +383,49 @@ def apply_tilt_shift_effect(img, frame_idx, total_frames):
     # Zoom effect
     zoom = 1.0 + 0.2 * progress
     center = (width // 2, height // 2)
-    M = cv2.getRotationMatrix2D(center, 0, zoom)
+    M = affine_matrix(center, zoom)
     transformed = cv2.warpAffine(img, M, (width, height), borderMode=cv2.BORDER_REFLECT)
     
     # Tilt-shift blur (focus on horizontal band)
     blurred = cv2.GaussianBlur(transformed, (21, 21), 0)
     focus_band = int(height * 0.4)
-    mask = np.zeros((height, 1), dtype=np.float32)
-    mask[focus_band:focus_band + int(height * 0.2)] = 1.0
+    fade = max(int(height * 0.15), 1)
     
-    # Smooth transition
-    for i in range(focus_band):
-        mask[i] = max(0, (i - (focus_band - int(height * 0.15))) / int(height * 0.15))
-    for i in range(focus_band + int(height * 0.2), height):
-        mask[i] = max(0, ((focus_band + int(height * 0.35) - i) / int(height * 0.15)))
+    # Per-row mask: ramps up into the band, flat inside it, ramps down after
+    y = np.arange(height, dtype=np.float32)
+    mask = np.clip((y - (focus_band - fade)) / fade, 0, 1)
+    mask *= np.clip(((focus_band + int(height * 0.35)) - y) / fade, 0, 1)
     
-    mask = np.tile(mask, (1, width))
-    result = (transformed * mask + blurred * (1 - mask)).astype(np.uint8)
+    # The mask is 0 outside the fades (blurred as-is) and 1 inside the band
+    # (sharp as-is), so only the fade rows need blending
+    result = blurred
+    band_end = focus_band + int(height * 0.2)
+    result[focus_band:band_end] = transformed[focus_band:band_end]
+    for start, stop in ((focus_band - fade, focus_band), (band_end, focus_band + int(height * 0.35))):
+        _blend_rows(transformed, result, mask, max(start, 0), min(stop, height))
     return result
 
 
 def read_image_with_fallback(path):
     """Attempt to read image using OpenCV first; if it fails and Pillow is available try that.
 
-    Returns a BGR numpy array (as OpenCV uses BGR) or None on failure.
+    Returns a 3-channel 8-bit BGR numpy array (as OpenCV uses BGR) or None on failure.
     """
     # Try OpenCV
     img = cv2.imread(path, cv2.IMREAD_UNCHANGED)
     if img is not None:
-        # Convert transparency to BGR if needed
-        if img.ndim == 3 and img.shape[2] == 4:
+        # Other depths down to 8 bits per channel: float images are [0, 1],
+        # integer ones (e.g. 16-bit PNG/TIFF) span their type's range
+        if img.dtype != np.uint8:
+            if np.issubdtype(img.dtype, np.floating):
+                scale = 255.0
+            else:
+                scale = 255.0 / np.iinfo(img.dtype).max
+            img = np.clip(np.rint(img * scale), 0, 255).astype(np.uint8)
+        # Convert grayscale and transparency to BGR if needed
+        if img.ndim == 2:
+            img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+        elif img.shape[2] == 4:
             img = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
         return img
 
@@ -155,48 +452,68 @@ def read_image_with_fallback(path):
 
     return None
 
-def apply_zoom_in_effect(img, frame_idx, total_frames):
-    """Apply continuous zoom-in effect."""
-    height, width = img.shape[:2]
+def zoom_in_matrix(frame_idx, total_frames, width, height):
+    """2x3 warp matrix of the zoom-in effect for one frame."""
     progress = frame_idx / max(total_frames - 1, 1)
     
     # Strong zoom (1.0 -> 2.0)
     zoom = 1.0 + 1.0 * progress
     
     center = (width // 2, height // 2)
-    M = cv2.getRotationMatrix2D(center, 0, zoom)
+    M = affine_matrix(center, zoom)
+    
+    return M
+
+def apply_zoom_in_effect(img, frame_idx, total_frames):
+    """Apply continuous zoom-in effect."""
+    height, width = img.shape[:2]
+    M = zoom_in_matrix(frame_idx, total_frames, width, height)
     transformed = cv2.warpAffine(img, M, (width, height), borderMode=cv2.BORDER_REFLECT)
     return transformed
 
-def apply_zoom_out_effect(img, frame_idx, total_frames):
-    """Apply continuous zoom-out effect."""
-    height, width = img.shape[:2]
+def zoom_out_matrix(frame_idx, total_frames, width, height):
+    """2x3 warp matrix of the zoom-out effect for one frame."""
     progress = frame_idx / max(total_frames - 1, 1)
     
     # Zoom out (1.2 -> 1.0)
     zoom = 1.2 - 0.2 * progress
     
     center = (width // 2, height // 2)
-    M = cv2.getRotationMatrix2D(center, 0, zoom)
+    M = affine_matrix(center, zoom)
+    
+    return M
+
+def apply_zoom_out_effect(img, frame_idx, total_frames):
+    """Apply continuous zoom-out effect."""
+    height, width = img.shape[:2]
+    M = zoom_out_matrix(frame_idx, total_frames, width, height)
     transformed = cv2.warpAffine(img, M, (width, height), borderMode=cv2.BORDER_REFLECT)
     return transformed
 
-def apply_dolly_zoom_effect(img, frame_idx, total_frames):
-    """Apply Dolly Zoom (perspective distortion) effect."""
-    height, width = img.shape[:2]
+def dolly_zoom_matrix(frame_idx, total_frames, width, height):
+    """2x3 warp matrix of the Dolly Zoom effect for one frame."""
     progress = frame_idx / max(total_frames - 1, 1)
     
     # Dynamic zoom and distortion
     zoom = 1.0 + 0.5 * np.sin(progress * np.pi)
     
     center = (width // 2, height // 2)
-    M = cv2.getRotationMatrix2D(center, 0, zoom)
+    M = affine_matrix(center, zoom)
     
     # Add slight rotation
     angle = 5 * np.sin(progress * np.pi * 2)
-    rotation_M = cv2.getRotationMatrix2D(center, angle, 1.0)
-    transformed = cv2.warpAffine(img, rotation_M, (width, height), borderMode=cv2.BORDER_REFLECT)
-    transformed = cv2.warpAffine(transformed, M, (width, height), borderMode=cv2.BORDER_REFLECT)
+    rotation_M = affine_matrix(center, 1.0, angle)
+    
+    # Rotate-then-zoom as a single warp instead of two full-frame passes
+    M = compose_affine(M, rotation_M)
+    
+    return M
+
+def apply_dolly_zoom_effect(img, frame_idx, total_frames):
+    """Apply Dolly Zoom (perspective distortion) effect."""
+    height, width = img.shape[:2]
+    M = dolly_zoom_matrix(frame_idx, total_frames, width, height)
+    transformed = cv2.warpAffine(img, M, (width, height), borderMode=cv2.BORDER_REFLECT)
     
     return transformed
 
@@ -205,19 +522,14 @@ def apply_wave_effect(img, frame_idx, total_frames):
     height, width = img.shape[:2]
     progress = frame_idx / max(total_frames - 1, 1)
     
-    # Create wave distortion
-    x, y = np.meshgrid(np.arange(width), np.arange(height))
-    
     # Wave parameters
     wave_freq = 0.01
     wave_amp = 20 * progress
     
-    x_wave = x + wave_amp * np.sin(y * wave_freq + progress * np.pi * 2)
-    y_wave = y + wave_amp * np.cos(x * wave_freq + progress * np.pi * 2)
-    
-    # Clip to valid range
-    x_wave = np.clip(x_wave, 0, width - 1).astype(np.float32)
-    y_wave = np.clip(y_wave, 0, height - 1).astype(np.float32)
+    # Create wave distortion (clipped to valid range) in reused map buffers
+    x_wave = _scratch_buffer('wave_x', (height, width))
+    y_wave = _scratch_buffer('wave_y', (height, width))
+    _build_wave_maps(x_wave, y_wave, width, height, wave_amp, wave_freq, progress * np.pi * 2)
     
     # Remap
     result = cv2.remap(img, x_wave, y_wave, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REFLECT)
@@ -231,55 +543,345 @@ def apply_radial_blur_effect(img, frame_idx, total_frames):
     center = (width // 2, height // 2)
     
     # Create motion blur effect radiating from center
-    result = img.astype(np.float32)
     blur_strength = int(1 + 4 * progress)
     
+    # Accumulate uint8 warps into one reused float32 buffer
+    accum = _scratch_buffer('radial_accum', img.shape)
+    zoomed = _scratch_buffer('radial_zoomed', img.shape, np.uint8)
+    accum.fill(0)
+    cv2.accumulate(img, accum)
+    
     for i in range(blur_strength):
         scale = 1.0 + 0.05 * i
-        M = cv2.getRotationMatrix2D(center, 0, scale)
-        zoomed = cv2.warpAffine(img.astype(np.float32), M, (width, height), 
-                               borderMode=cv2.BORDER_REFLECT)
-        result += zoomed
+        M = affine_matrix(center, scale)
+        cv2.warpAffine(img, M, (width, height), dst=zoomed, borderMode=cv2.BORDER_REFLECT)
+        cv2.accumulate(zoomed, accum)
     
-    result = (result / (blur_strength + 1)).astype(np.uint8)
+    result = cv2.convertScaleAbs(accum, alpha=1.0 / (blur_strength + 1))
     return result
 
-def apply_rotation_effect(img, frame_idx, total_frames):
-    """Apply smooth rotation effect."""
-    height, width = img.shape[:2]
+def rotation_matrix(frame_idx, total_frames, width, height):
+    """2x3 warp matrix of the rotation effect for one frame."""
     progress = frame_idx / max(total_frames - 1, 1)
     
     # Full rotation (360 degrees)
     angle = 360 * progress
     
     center = (width // 2, height // 2)
-    M = cv2.getRotationMatrix2D(center, angle, 1.0)
+    M = affine_matrix(center, 1.0, angle)
+    
+    return M
+
+def apply_rotation_effect(img, frame_idx, total_frames):
+    """Apply smooth rotation effect."""
+    height, width = img.shape[:2]
+    M = rotation_matrix(frame_idx, total_frames, width, height)
     transformed = cv2.warpAffine(img, M, (width, height), borderMode=cv2.BORDER_REFLECT)
     
     return transformed
 
-def apply_flip_effect(img, frame_idx, total_frames):
-    """Apply flip effect with zoom."""
-    height, width = img.shape[:2]
+def flip_matrix(frame_idx, total_frames, width, height):
+    """2x3 warp matrix of the flip-with-zoom effect for one frame."""
     progress = frame_idx / max(total_frames - 1, 1)
     
     # Alternate flips with zoom
     flips = int(progress * 3)
-    result = img.copy()
-    
-    if flips % 2 == 1:
-        result = cv2.flip(result, 1)  # Horizontal flip
     
     zoom = 1.0 + 0.2 * np.sin(progress * np.pi * 2)
     center = (width // 2, height // 2)
-    M = cv2.getRotationMatrix2D(center, 0, zoom)
-    result = cv2.warpAffine(result, M, (width, height), borderMode=cv2.BORDER_REFLECT)
+    M = affine_matrix(center, zoom)
+    
+    if flips % 2 == 1:
+        # Horizontal flip folded into the zoom matrix (x -> width - 1 - x)
+        flip_M = np.array([[-1.0, 0.0, width - 1], [0.0, 1.0, 0.0]])
+        M = compose_affine(M, flip_M)
+    
+    return M
+
+def apply_flip_effect(img, frame_idx, total_frames):
+    """Apply flip effect with zoom."""
+    height, width = img.shape[:2]
+    M = flip_matrix(frame_idx, total_frames, width, height)
+    
+    result = cv2.warpAffine(img, M, (width, height), borderMode=cv2.BORDER_REFLECT)
     
     return result
 
+# Motion function mapping
+MOTION_FUNCTIONS = {
+    'subtle': apply_subtle_motion,
+    'ken-burns': apply_ken_burns_effect,
+    '360-pan': apply_360_pan_effect,
+    'tilt-shift': apply_tilt_shift_effect,
+    'zoom-in': apply_zoom_in_effect,
+    'zoom-out': apply_zoom_out_effect,
+    'dolly-zoom': apply_dolly_zoom_effect,
+    'wave': apply_wave_effect,
+    'radial-blur': apply_radial_blur_effect,
+    'rotation': apply_rotation_effect,
+    'flip': apply_flip_effect,
+    'none': None
+}
+
+# Effects that are a single affine warp of the source, by their matrix function
+AFFINE_EFFECT_MATRICES = {
+    'subtle': subtle_motion_matrix,
+    'ken-burns': ken_burns_matrix,
+    'zoom-in': zoom_in_matrix,
+    'zoom-out': zoom_out_matrix,
+    'dolly-zoom': dolly_zoom_matrix,
+    'rotation': rotation_matrix,
+    'flip': flip_matrix,
+}
+
+def build_effect_schedule(motion_type, total_frames, width, height):
+    """
+    Precompute the per-frame 2x3 warp matrices of an affine effect.
+    
+    Lets the encoding loop run plain warpAffine calls with no per-frame
+    trigonometry. Returns a list with one matrix per frame, or None for
+    effects that are not a single affine warp (their apply_* function is
+    called per frame instead).
+    """
+    matrix_func = AFFINE_EFFECT_MATRICES.get(motion_type)
+    if matrix_func is None:
+        return None
+    return [matrix_func(frame_idx, total_frames, width, height) for frame_idx in range(total_frames)]
+
+def _init_worker():
+    """Limit each worker process to one thread; parallelism comes from the pool."""
+    cv2.setNumThreads(1)
+    if NUMBA_AVAILABLE:
+        set_num_threads(1)
+
+def _load_image(img_path, target_size):
+    """Read an image as 3-channel uint8 BGR resized to `target_size`; None if it can't be read."""
+    # Read and prepare image
+    # Use fallback image loader which tries cv2 then Pillow
+    img = read_image_with_fallback(img_path)
+    if img is None and PIL_AVAILABLE:
+        try:
+            pil_img = Image.open(img_path).convert('RGB')
+            img = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
+        except Exception as e:
+            print(f"Skipping '{img_path}': {e}")
+            return None
+    elif img is None:
+        print(f"Skipping '{img_path}' - OpenCV couldn't read it (Pillow not available for fallback)")
+        return None
+    
+    # Resize to target: area averaging when shrinking, bicubic when enlarging
+    if img.shape[1] > target_size[0] or img.shape[0] > target_size[1]:
+        interpolation = cv2.INTER_AREA
+    else:
+        interpolation = cv2.INTER_CUBIC
+    return cv2.resize(img, target_size, interpolation=interpolation)
+
+def _prefetch_images(images, target_size, maxsize=2):
+    """
+    Yield (img_path, img, error) for each path, loading upcoming images on a background thread.
+    
+    Decoding and resizing release the GIL, so the next image loads while the
+    current one is being rendered. `img` is None for unreadable files and for
+    files whose loading failed; `error` is the loader's exception, if any.
+    """
+    prefetched = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+    
+    def producer():
+        for img_path in images:
+            if stop.is_set():
+                return
+            try:
+                img, error = _load_image(img_path, target_size), None
+            except Exception as e:
+                img, error = None, e
+            prefetched.put((img_path, img, error))
+    
+    loader = threading.Thread(target=producer, daemon=True)
+    loader.start()
+    try:
+        for _ in images:
+            yield prefetched.get()
+    finally:
+        # Stop early on error/close; drain so a producer blocked on put() can exit
+        stop.set()
+        while loader.is_alive():
+            try:
+                prefetched.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+def _process_one_image(img_path, output_dir, motion_types, total_frames, target_size,
+                       fps, quality, video_duration, encoder=None):
+    """
+    Render a single image into its own motion video.
+    
+    Kept at module level so it can be dispatched to worker processes.
+    
+    Returns:
+        Video metadata dict, or None if the image could not be read
+    """
+    img = _load_image(img_path, target_size)
+    if img is None:
+        return None
+    return _render_video(img, img_path, output_dir, motion_types, total_frames, target_size,
+                         fps, quality, video_duration, encoder)
+
+def _cuda_affine_renderer(img, target_size):
+    """
+    Return a render(M) function that warps `img` on the GPU.
+    
+    The image is uploaded once; each frame is warped on a CUDA stream and
+    downloaded into one reused host buffer for the video writer.
+    Returns None if the GPU cannot be used (e.g. out of memory); if a warp
+    fails later, that frame and the rest are warped with cv2.warpAffine.
+    """
+    host_dst = np.empty((target_size[1], target_size[0], img.shape[2]), dtype=img.dtype)
+    try:
+        stream = cv2.cuda.Stream()
+        gpu_src = cv2.cuda_GpuMat()
+        gpu_src.upload(img, stream)
+        gpu_dst = cv2.cuda_GpuMat(target_size[1], target_size[0], gpu_src.type())
+    except Exception as e:
+        print(f"CUDA warp unavailable, using the CPU: {e}")
+        return None
+    use_gpu = True
+    
+    def render(M):
+        nonlocal use_gpu
+        if use_gpu:
+            try:
+                cv2.cuda.warpAffine(gpu_src, M, target_size, gpu_dst, flags=cv2.INTER_LINEAR,
+                                    borderMode=cv2.BORDER_REFLECT, stream=stream)
+                gpu_dst.download(stream, host_dst)
+                stream.waitForCompletion()
+                return host_dst
+            except Exception as e:
+                print(f"CUDA warp failed, using the CPU: {e}")
+                use_gpu = False
+        return cv2.warpAffine(img, M, target_size, host_dst, cv2.INTER_LINEAR, cv2.BORDER_REFLECT)
+    
+    return render
+
+def segment_bounds(total_frames, segment_count):
+    """
+    Split `total_frames` into `segment_count` consecutive (start, end) frame ranges.
+    
+    Segments are equal in time (boundaries at int(i * total_frames / count));
+    the last one always ends at `total_frames`, so every frame belongs to
+    exactly one segment and each segment starts at progress 0.
+    """
+    segment_duration = total_frames / segment_count
+    starts = [int(i * segment_duration) for i in range(segment_count)]
+    return list(zip(starts, starts[1:] + [total_frames]))
+
+def _build_frame_plan(img, motion_types, total_frames, target_size):
+    """
+    Build the (render, args, check) entry for every frame of a video.
+    
+    `render(*args)` returns the frame to write; `render` is None for static
+    frames, which are `img` itself (motion functions never modify their input).
+    `check` is True on the first frame of each segment, where the output of
+    that segment's render function is validated.
+    """
+    # Warp target reused across frames: each frame is written before the next is made
+    warped = np.empty_like(img)
+    cuda_warp = None
+    if CUDA_AVAILABLE and any(mt in AFFINE_EFFECT_MATRICES for mt in motion_types):
+        # Uploaded once, only if some segment is a plain warp
+        cuda_warp = _cuda_affine_renderer(img, target_size)
+    
+    frame_plan = []
+    segments = segment_bounds(total_frames, len(motion_types))
+    for motion_type, (segment_start, segment_end) in zip(motion_types, segments):
+        frames_in_segment = segment_end - segment_start
+        
+        motion_func = MOTION_FUNCTIONS[motion_type]
+        schedule = build_effect_schedule(motion_type, frames_in_segment, target_size[0], target_size[1])
+        
+        # Frame progress within this effect's segment (0.0 to 1.0)
+        for frame_in_segment in range(frames_in_segment):
+            check = frame_in_segment == 0
+            if schedule is not None and cuda_warp is not None:
+                frame_plan.append((cuda_warp, (schedule[frame_in_segment],), check))
+            elif schedule is not None:
+                frame_plan.append((cv2.warpAffine, (img, schedule[frame_in_segment], target_size,
+                                                    warped, cv2.INTER_LINEAR, cv2.BORDER_REFLECT),
+                                   check))
+            elif motion_func is not None:
+                # Apply effect with progress relative to segment
+                frame_plan.append((motion_func, (img, frame_in_segment, frames_in_segment), check))
+            else:
+                frame_plan.append((None, None, False))
+    return frame_plan
+
+def _render_video(img, img_path, output_dir, motion_types, total_frames, target_size,
+                  fps, quality, video_duration, encoder=None):
+    """Render an already loaded and resized image into its motion video; returns its metadata."""
+    base_name = os.path.splitext(os.path.basename(img_path))[0]
+    motion_suffix = '_'.join(motion_types[:3])
+    output_base = os.path.join(output_dir, f"{base_name}_motion_{motion_suffix}_{quality}")
+    bitrate_factor = QUALITY_PRESETS[quality][2]
+    
+    if motion_types == ['none'] and total_frames > 0:
+        # Static video: every frame is identical, so encode it once
+        output_path = write_still_video(output_base, img, total_frames, fps, target_size,
+                                        bitrate_factor, encoder)
+        return _video_info(output_path, motion_types, video_duration, fps, quality, target_size)
+    
+    # Generate frames with motion effects divided equally by time; all
+    # per-frame decisions are made up front so the loop only renders and writes
+    frame_plan = _build_frame_plan(img, motion_types, total_frames, target_size)
+    
+    # Create video writer (H.264 via ffmpeg when available, else XVID)
+    writer, output_path = open_video_writer(output_base, fps, target_size, bitrate_factor, encoder)
+    write = writer.write
+    try:
+        for render, args, check in frame_plan:
+            frame = render(*args) if render is not None else img
+            # The loader guarantees 3-channel uint8 BGR and effects preserve it, so
+            # frames go to the writer unconverted; check that once per segment
+            if check and (frame.dtype != np.uint8 or frame.shape != img.shape):
+                raise TypeError(f"Motion effect returned a {frame.dtype} frame of shape "
+                                f"{frame.shape}; expected uint8 {img.shape}")
+            write(frame)
+    except Exception:
+        # Don't leave a truncated video behind, whatever release() reports
+        try:
+            writer.release()
+        except Exception:
+            pass
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        raise
+    
+    writer.release()
+    
+    return _video_info(output_path, motion_types, video_duration, fps, quality, target_size)
+
+def _video_info(output_path, motion_types, video_duration, fps, quality, target_size):
+    """Build the metadata dict reported for a finished video."""
+    # Calculate file size and time generated
+    file_size = os.path.getsize(output_path) / (1024 * 1024)
+    time_generated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
+    return {
+        'path': output_path,
+        'filename': os.path.basename(output_path),
+        'size_mb': round(file_size, 2),
+        'duration_seconds': video_duration,
+        'fps': fps,
+        'quality': quality,
+        'resolution': f"{target_size[0]}x{target_size[1]}",
+        'motion_effects': motion_types,
+        'time_generated': time_generated,
+        'speed': f"{fps}fps"
+    }
+
 def create_video_per_image_with_motion(input_dir, output_dir, motion_types=['subtle'], 
                                        video_duration=5.0, fps=10, quality='1080p',
-                                       progress_callback=None):
+                                       progress_callback=None, max_workers=None):
     """
     Convert each input image into a separate video with motion effects.
     
@@ -294,9 +896,16 @@ def create_video_per_image_with_motion(input_dir, output_dir, motion_types=['sub
         fps: Frames per second
         quality: Quality preset ('4K', '1080p', '720p', '480p', '360p')
         progress_callback: Function to call with (current, total) for progress tracking
+        max_workers: Number of worker processes (defaults to the CPU count, at most
+                     CUDA_MAX_WORKERS when warping on the GPU;
+                     1 renders serially in the calling process)
     
     Returns:
-        List of created video file paths with metadata
+        List of created video file paths with metadata; images that failed
+        are skipped and listed in metadata['failed']
+    
+    Raises:
+        RuntimeError: if every image failed, or the worker pool broke
     """
     os.makedirs(output_dir, exist_ok=True)
     
@@ -312,7 +921,6 @@ def create_video_per_image_with_motion(input_dir, output_dir, motion_types=['sub
     
     total_images = len(images)
     total_frames = int(video_duration * fps)
-    created_videos = []
     
     # Normalize motion_types to list
     if isinstance(motion_types, str):
@@ -320,111 +928,89 @@ def create_video_per_image_with_motion(input_dir, output_dir, motion_types=['sub
     else:
         motion_types = list(motion_types)[:3]  # Max 3 effects
     
-    # Motion function mapping
-    motion_functions = {
-        'subtle': apply_subtle_motion,
-        'ken-burns': apply_ken_burns_effect,
-        '360-pan': apply_360_pan_effect,
-        'tilt-shift': apply_tilt_shift_effect,
-        'zoom-in': apply_zoom_in_effect,
-        'zoom-out': apply_zoom_out_effect,
-        'dolly-zoom': apply_dolly_zoom_effect,
-        'wave': apply_wave_effect,
-        'radial-blur': apply_radial_blur_effect,
-        'rotation': apply_rotation_effect,
-        'flip': apply_flip_effect,
-        'none': None
-    }
-    
     # Validate motion types
-    motion_types = [mt for mt in motion_types if mt in motion_functions]
+    motion_types = [mt for mt in motion_types if mt in MOTION_FUNCTIONS]
     if not motion_types:
         motion_types = ['none']
     
     start_time = datetime.now()
     
-    for img_idx, img_path in enumerate(images):
-        # Read and prepare image
-        # Use fallback image loader which tries cv2 then Pillow
-        img = read_image_with_fallback(img_path)
-        if img is None and PIL_AVAILABLE:
-            try:
-                pil_img = Image.open(img_path).convert('RGB')
-                img = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
-            except Exception as e:
-                print(f"Skipping '{img_path}': {e}")
-                continue
-        elif img is None:
-            print(f"Skipping '{img_path}' - OpenCV couldn't read it (Pillow not available for fallback)")
-            continue
-        
-        # Resize to target
-        img = cv2.resize(img, target_size, interpolation=cv2.INTER_LANCZOS4)
-        
-        # Create video writer (using XVID codec for Windows compatibility)
-        base_name = os.path.splitext(os.path.basename(img_path))[0]
-        motion_suffix = '_'.join(motion_types[:3])
-        output_path = os.path.join(output_dir, f"{base_name}_motion_{motion_suffix}_{quality}.avi")
-        
-        fourcc = cv2.VideoWriter_fourcc(*'XVID')
-        writer = cv2.VideoWriter(output_path, fourcc, fps, target_size)
-        
-        # Generate frames with motion effects divided equally by time
-        for frame_idx in range(total_frames):
-            frame = img.copy()
-            
-            # Determine which effect segment this frame belongs to
-            segment_duration = total_frames / len(motion_types)
-            current_segment = int(frame_idx / segment_duration)
-            current_segment = min(current_segment, len(motion_types) - 1)  # Clamp to last segment
-            
-            # Get the motion type for this segment
-            motion_type = motion_types[current_segment]
-            
-            # Apply the effect for this segment
-            if motion_type in motion_functions and motion_functions[motion_type] is not None:
-                motion_func = motion_functions[motion_type]
-                # Frame progress within this effect's segment (0.0 to 1.0)
-                segment_start = int(current_segment * segment_duration)
-                segment_end = int((current_segment + 1) * segment_duration)
-                frame_in_segment = frame_idx - segment_start
-                frames_in_segment = segment_end - segment_start
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if CUDA_AVAILABLE and any(mt in AFFINE_EFFECT_MATRICES for mt in motion_types):
+        # More processes than this only queue on the GPU and can exhaust its memory
+        max_workers = min(max_workers, CUDA_MAX_WORKERS)
+    max_workers = max(1, min(max_workers, total_images))
+    
+    # Probe the encoder once here rather than in every worker
+    encoder = detect_ffmpeg_encoder()
+    if encoder is not None and max_workers > 1:
+        # Each worker runs its own ffmpeg: split the cores between them
+        ffmpeg, name, args = encoder
+        encoder_threads = max(1, (os.cpu_count() or 1) // max_workers)
+        encoder = (ffmpeg, name, args + ['-threads', str(encoder_threads)])
+    job_args = (output_dir, motion_types, total_frames, target_size, fps, quality,
+                video_duration, encoder)
+    
+    # Results are kept in input order regardless of completion order
+    results = [None] * total_images
+    # One failing image is reported and skipped, not fatal to the batch
+    failures = []
+    last_error = None
+    
+    def skip(img_path, error):
+        print(f"Skipping '{img_path}': {error}")
+        failures.append({'filename': os.path.basename(img_path), 'error': str(error)})
+    
+    if max_workers == 1:
+        # Load the next image while the current one renders
+        with closing(_prefetch_images(images, target_size)) as prefetched:
+            for img_idx, (img_path, img, error) in enumerate(prefetched):
+                if img is not None:
+                    try:
+                        results[img_idx] = _render_video(img, img_path, *job_args)
+                    except Exception as e:
+                        error = last_error = e
+                elif error is None:
+                    error = "could not read image"
+                else:
+                    last_error = error
+                if error is not None:
+                    skip(img_path, error)
                 
-                # Apply effect with progress relative to segment
-                frame = motion_func(frame, frame_in_segment, frames_in_segment)
-            
-            # Ensure frame is 3-channel BGR
-            if len(frame.shape) == 2:
-                frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
-            elif frame.shape[2] == 4:
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
-            
-            writer.write(frame.astype(np.uint8))
-        
-        writer.release()
-        
-        # Calculate file size and time generated
-        file_size = os.path.getsize(output_path) / (1024 * 1024)
-        time_generated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        video_info = {
-            'path': output_path,
-            'filename': os.path.basename(output_path),
-            'size_mb': round(file_size, 2),
-            'duration_seconds': video_duration,
-            'fps': fps,
-            'quality': quality,
-            'resolution': f"{target_size[0]}x{target_size[1]}",
-            'motion_effects': motion_types,
-            'time_generated': time_generated,
-            'speed': f"{fps}fps"
-        }
-        
-        created_videos.append(video_info)
-        
-        # Call progress callback
-        if progress_callback:
-            progress_callback(img_idx + 1, total_images)
+                # Call progress callback
+                if progress_callback:
+                    progress_callback(img_idx + 1, total_images)
+    else:
+        # Spawned (not forked) workers: the caller may be a threaded Flask
+        # process, and OpenCV/numba thread pools are not fork-safe
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_worker) as executor:
+            futures = {executor.submit(_process_one_image, img_path, *job_args): img_idx
+                       for img_idx, img_path in enumerate(images)}
+            for completed, future in enumerate(as_completed(futures), 1):
+                img_idx = futures[future]
+                try:
+                    results[img_idx] = future.result()
+                except BrokenProcessPool:
+                    # A dead worker fails every image, not just this one
+                    raise
+                except Exception as e:
+                    last_error = e
+                    skip(images[img_idx], e)
+                else:
+                    if results[img_idx] is None:
+                        skip(images[img_idx], "could not read image")
+                
+                # Call progress callback
+                if progress_callback:
+                    progress_callback(completed, total_images)
+    
+    created_videos = [video_info for video_info in results if video_info is not None]
+    if not created_videos and last_error is not None:
+        # Every image failed (ffmpeg, GPU, ...): that is the batch failing, not a skip
+        raise RuntimeError(f"All {total_images} images failed; last error: {last_error}") from last_error
     
     end_time = datetime.now()
     processing_time = (end_time - start_time).total_seconds()
@@ -434,6 +1020,7 @@ def create_video_per_image_with_motion(input_dir, output_dir, motion_types=['sub
         'end_time': end_time.strftime("%Y-%m-%d %H:%M:%S"),
         'total_processing_time': round(processing_time, 2),
         'videos_created': len(created_videos),
+        'failed': failures,
         'quality': quality,
         'motion_effects': motion_types
     }
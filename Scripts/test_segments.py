@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""Check segment frame counts, warp matrices and the ffmpeg repeat count."""
+import os
+import sys
+import tempfile
+import cv2
+import numpy as np
+
+from converter import (segment_bounds, _build_frame_plan, MOTION_FUNCTIONS, affine_matrix,
+                       apply_zoom_in_effect, apply_rotation_effect,
+                       detect_ffmpeg_encoder, FFmpegVideoWriter)
+
+failures = 0
+
+def check(label, ok, detail=""):
+    global failures
+    if ok:
+        print(f"  ✓ {label}")
+    else:
+        failures += 1
+        print(f"  ✗ {label} {detail}")
+
+# Synthetic image so no Input folder is needed
+rng = np.random.default_rng(0)
+img = rng.integers(0, 256, (90, 160, 3), dtype=np.uint8)
+height, width = img.shape[:2]
+
+print("Segment frame counts:")
+for total_frames in (0, 1, 2, 50, 51, 149):
+    for segment_count in (1, 2, 3, 7):
+        bounds = segment_bounds(total_frames, segment_count)
+        counts = [end - start for start, end in bounds]
+        contiguous = all(bounds[i][1] == bounds[i + 1][0] for i in range(len(bounds) - 1))
+        check(f"{total_frames} frames / {segment_count} segments -> {counts}",
+              len(bounds) == segment_count and sum(counts) == total_frames
+              and bounds[0][0] == 0 and contiguous and max(counts) - min(counts) <= 1)
+
+motion_types = ['zoom-in', 'rotation', 'none', 'wave']
+frame_plan = _build_frame_plan(img, motion_types, 50, (width, height))
+check(f"frame plan of {motion_types} has 50 frames", len(frame_plan) == 50,
+      f"(got {len(frame_plan)})")
+
+# Every segment restarts its effect at progress 0 and runs for its own frame count
+for motion_type, (start, end) in zip(motion_types, segment_bounds(50, len(motion_types))):
+    effect = MOTION_FUNCTIONS[motion_type]
+    diff = 0
+    for frame_in_segment, entry in enumerate(frame_plan[start:end]):
+        render, args = entry[0], entry[1]
+        frame = render(*args) if render is not None else img
+        expected = effect(img, frame_in_segment, end - start) if effect is not None else img
+        diff = max(diff, int(np.abs(frame.astype(np.int16) - expected).max()))
+    check(f"{motion_type} segment frames {start}-{end} match the effect", diff <= 1,
+          f"(max diff {diff})")
+
+print("\naffine_matrix vs cv2.getRotationMatrix2D:")
+for center, zoom, angle in [((80, 45), 1.0, 0.0), ((80, 45), 1.5, 0.0),
+                            ((80, 45), 1.2, 37.5), ((10.5, 3), 0.8, -90.0),
+                            ((80, 45), 2.0, 360.0)]:
+    expected = cv2.getRotationMatrix2D(center, angle, zoom)
+    M = affine_matrix(center, zoom, angle)
+    check(f"center={center} zoom={zoom} angle={angle}", np.allclose(M, expected, atol=1e-9),
+          f"(max diff {np.abs(M - expected).max():.3g})")
+
+print("\nEffects vs warps built from cv2.getRotationMatrix2D:")
+center = (width // 2, height // 2)
+for frame_idx, total_frames in [(0, 50), (25, 50), (49, 50), (0, 1)]:
+    progress = frame_idx / max(total_frames - 1, 1)
+    cases = [
+        ("zoom_in", apply_zoom_in_effect, cv2.getRotationMatrix2D(center, 0, 1.0 + progress)),
+        ("rotation", apply_rotation_effect, cv2.getRotationMatrix2D(center, 360 * progress, 1.0)),
+    ]
+    for name, effect, expected_M in cases:
+        expected = cv2.warpAffine(img, expected_M, (width, height), borderMode=cv2.BORDER_REFLECT)
+        frame = effect(img, frame_idx, total_frames)
+        diff = int(np.abs(frame.astype(np.int16) - expected).max())
+        check(f"{name} frame {frame_idx}/{total_frames}", diff <= 1, f"(max diff {diff})")
+
+print("\nffmpeg repeat frame count:")
+encoder = detect_ffmpeg_encoder()
+if encoder is None:
+    print("  - ffmpeg not found, skipped")
+else:
+    with tempfile.TemporaryDirectory() as tmp:
+        for repeat in (1, 2, 37):
+            output_path = os.path.join(tmp, f"repeat_{repeat}.mp4")
+            writer = FFmpegVideoWriter(output_path, 25, (width, height), encoder, 1000, repeat=repeat)
+            writer.write(img)
+            writer.release()
+            cap = cv2.VideoCapture(output_path)
+            frames = 0
+            while cap.read()[0]:
+                frames += 1
+            cap.release()
+            check(f"repeat={repeat} -> {frames} frames", frames == repeat)
+
+if failures:
+    print(f"\n✗ {failures} check(s) failed")
+    sys.exit(1)
+print("\n✓ All checks passed!")
@@ -4,7 +4,10 @@ import os
 # Check if we can read one of the created videos
 import os as __os
 __script_dir = __os.path.dirname(__os.path.abspath(__file__))
-video_path = __os.path.join(__script_dir, "Output", "IMG_4707_motion_zoom-in_480p.avi")
+video_path = __os.path.join(__script_dir, "Output", "IMG_4707_motion_zoom-in_480p.mp4")
+if not __os.path.exists(video_path):
+    # Converter falls back to XVID .avi when ffmpeg is not installed
+    video_path = video_path[:-len(".mp4")] + ".avi"
 
 if os.path.exists(video_path):
     cap = cv2.VideoCapture(video_path)